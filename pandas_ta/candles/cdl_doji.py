@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.overlap import sma
-from pandas_ta.utils import get_offset, high_low_range, is_percent
+from pandas_ta.utils import fill, get_offset, high_low_range, is_percent
 from pandas_ta.utils import real_body, verify_series
 
 
@@ -38,7 +38,7 @@ def cdl_doji(open_, high, low, close, length=None, factor=None, scalar=None, asi
     if "fillna" in kwargs:
         doji.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        doji.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(doji, kwargs["fill_method"])
 
     # Name and Categorize it
     doji.name = f"CDL_DOJI_{length}_{0.01 * factor}"
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import candle_color, get_offset
+from pandas_ta.utils import candle_color, fill, get_offset
 from pandas_ta.utils import verify_series
 
 
@@ -26,7 +26,7 @@ def cdl_inside(open_, high, low, close, asbool=False, offset=None, **kwargs):
     if "fillna" in kwargs:
         inside.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        inside.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(inside, kwargs["fill_method"])
 
     # Name and Categorize it
     inside.name = f"CDL_INSIDE"
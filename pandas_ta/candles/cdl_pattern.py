@@ -3,7 +3,7 @@ from typing import Sequence, Union
 from pandas import Series, DataFrame
 
 from . import cdl_doji, cdl_inside
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 from pandas_ta import Imports
 
 
@@ -72,7 +72,7 @@ def cdl_pattern(open_, high, low, close, name: Union[str, Sequence[str]]="all",
             if "fillna" in kwargs:
                 pattern_result.fillna(kwargs["fillna"], inplace=True)
             if "fill_method" in kwargs:
-                pattern_result.fillna(method=kwargs["fill_method"], inplace=True)
+                fill(pattern_result, kwargs["fill_method"])
 
             result[f"CDL_{n.upper()}"] = pattern_result
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.statistics import zscore
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def cdl_z(open_, high, low, close, length=None, full=None, ddof=None, offset=None, **kwargs):
@@ -37,7 +37,7 @@ def cdl_z(open_, high, low, close, length=None, full=None, ddof=None, offset=Non
     })
 
     if full:
-        df.fillna(method="backfill", axis=0, inplace=True)
+        df.bfill(axis=0, inplace=True)
 
     # Offset
     if offset != 0:
@@ -47,7 +47,7 @@ def cdl_z(open_, high, low, close, length=None, full=None, ddof=None, offset=Non
     if "fillna" in kwargs:
         df.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        df.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(df, kwargs["fill_method"])
 
     # Name and Categorize it
     df.name = f"CDL_Z{_props}"
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def ha(open_, high, low, close, offset=None, **kwargs):
@@ -35,7 +35,7 @@ def ha(open_, high, low, close, offset=None, **kwargs):
     if "fillna" in kwargs:
         df.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        df.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(df, kwargs["fill_method"])
 
     # Name and Categorize it
     df.name = "Heikin-Ashi"
@@ -6,7 +6,7 @@ from numpy import pi as npPi
 from numpy import sin as npSin
 from numpy import sqrt as npSqrt
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def ebsw(close, length=None, bars=None, offset=None, **kwargs):
@@ -68,7 +68,7 @@ def ebsw(close, length=None, bars=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         ebsw.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        ebsw.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(ebsw, kwargs["fill_method"])
 
     # Name and Categorize it
     ebsw.name = f"EBSW_{length}_{bars}"
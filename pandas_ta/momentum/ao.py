@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.overlap import sma
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def ao(high, low, fast=None, slow=None, offset=None, **kwargs):
@@ -31,7 +31,7 @@ def ao(high, low, fast=None, slow=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         ao.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        ao.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(ao, kwargs["fill_method"])
 
     # Name and Categorize it
     ao.name = f"AO_{fast}_{slow}"
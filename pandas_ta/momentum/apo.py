@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_offset, tal_ma, verify_series
+from pandas_ta.utils import fill, get_offset, tal_ma, verify_series
 
 
 def apo(close, fast=None, slow=None, mamode=None, talib=None, offset=None, **kwargs):
@@ -35,7 +35,7 @@ def apo(close, fast=None, slow=None, mamode=None, talib=None, offset=None, **kwa
     if "fillna" in kwargs:
         apo.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        apo.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(apo, kwargs["fill_method"])
 
     # Name and Categorize it
     apo.name = f"APO_{fast}_{slow}"
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def bias(close, length=None, mamode=None, offset=None, **kwargs):
@@ -25,7 +25,7 @@ def bias(close, length=None, mamode=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         bias.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        bias.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(bias, kwargs["fill_method"])
 
     # Name and Categorize it
     bias.name = f"BIAS_{bma.name}"
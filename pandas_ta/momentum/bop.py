@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_offset, non_zero_range, verify_series
 
 
 def bop(open_, high, low, close, scalar=None, talib=None, offset=None, **kwargs):
@@ -31,7 +31,7 @@ def bop(open_, high, low, close, scalar=None, talib=None, offset=None, **kwargs)
     if "fillna" in kwargs:
         bop.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        bop.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(bop, kwargs["fill_method"])
 
     # Name and Categorize it
     bop.name = f"BOP"
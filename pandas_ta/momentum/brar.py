@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, non_zero_range, verify_series
 
 
 def brar(open_, high, low, close, length=None, scalar=None, drift=None, offset=None, **kwargs):
@@ -42,8 +42,8 @@ def brar(open_, high, low, close, length=None, scalar=None, drift=None, offset=N
         ar.fillna(kwargs["fillna"], inplace=True)
         br.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        ar.fillna(method=kwargs["fill_method"], inplace=True)
-        br.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(ar, kwargs["fill_method"])
+        fill(br, kwargs["fill_method"])
 
     # Name and Categorize it
     _props = f"_{length}"
@@ -2,7 +2,7 @@
 from pandas_ta import Imports
 from pandas_ta.overlap import hlc3, sma
 from pandas_ta.statistics.mad import mad
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def cci(high, low, close, length=None, c=None, talib=None, offset=None, **kwargs):
@@ -38,7 +38,7 @@ def cci(high, low, close, length=None, c=None, talib=None, offset=None, **kwargs
     if "fillna" in kwargs:
         cci.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        cci.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(cci, kwargs["fill_method"])
 
     # Name and Categorize it
     cci.name = f"CCI_{length}_{c}"
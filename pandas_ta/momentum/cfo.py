@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.overlap import linreg
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def cfo(close, length=None, scalar=None, drift=None, offset=None, **kwargs):
@@ -26,7 +26,7 @@ def cfo(close, length=None, scalar=None, drift=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         cfo.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        cfo.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(cfo, kwargs["fill_method"])
 
     # Name and Categorize it
     cfo.name = f"CFO_{length}"
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series, weights
+from pandas_ta.utils import fill, get_offset, verify_series, weighted_window
 
 
 def cg(close, length=None, offset=None, **kwargs):
@@ -13,7 +13,7 @@ def cg(close, length=None, offset=None, **kwargs):
 
     # Calculate Result
     coefficients = [length - i for i in range(0, length)]
-    numerator = -close.rolling(length).apply(weights(coefficients), raw=True)
+    numerator = -weighted_window(close, coefficients)
     cg = numerator / close.rolling(length).sum()
 
     # Offset
@@ -24,7 +24,7 @@ def cg(close, length=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         cg.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        cg.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(cg, kwargs["fill_method"])
 
     # Name and Categorize it
     cg.name = f"CG_{length}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
 from pandas_ta.overlap import rma
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def cmo(close, length=None, scalar=None, talib=None, drift=None, offset=None, **kwargs):
@@ -42,7 +42,7 @@ def cmo(close, length=None, scalar=None, talib=None, drift=None, offset=None, **
     if "fillna" in kwargs:
         cmo.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        cmo.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(cmo, kwargs["fill_method"])
 
     # Name and Categorize it
     cmo.name = f"CMO_{length}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from .roc import roc
 from pandas_ta.overlap import wma
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def coppock(close, length=None, fast=None, slow=None, offset=None, **kwargs):
@@ -27,7 +27,7 @@ def coppock(close, length=None, fast=None, slow=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         coppock.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        coppock.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(coppock, kwargs["fill_method"])
 
     # Name and Categorize it
     coppock.name = f"COPC_{fast}_{slow}_{length}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import Series
 from pandas_ta.overlap import linreg
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def cti(close, length=None, offset=None, **kwargs) -> Series:
@@ -20,9 +20,9 @@ def cti(close, length=None, offset=None, **kwargs) -> Series:
 
     # Handle fills
     if "fillna" in kwargs:
-        cti.fillna(method=kwargs["fillna"], inplace=True)
+        cti.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        cti.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(cti, kwargs["fill_method"])
 
     cti.name = f"CTI_{length}"
     cti.category = "momentum"
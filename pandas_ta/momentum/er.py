@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame, concat
-from pandas_ta.utils import get_drift, get_offset, verify_series, signals
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series, signals
 
 
 def er(close, length=None, drift=None, offset=None, **kwargs):
@@ -28,7 +28,7 @@ def er(close, length=None, drift=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         er.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        er.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(er, kwargs["fill_method"])
 
     # Name and Categorize it
     er.name = f"ER_{length}"
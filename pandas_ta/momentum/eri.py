@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.overlap import ema
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def eri(high, low, close, length=None, offset=None, **kwargs):
@@ -30,8 +30,8 @@ def eri(high, low, close, length=None, offset=None, **kwargs):
         bull.fillna(kwargs["fillna"], inplace=True)
         bear.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        bull.fillna(method=kwargs["fill_method"], inplace=True)
-        bear.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(bull, kwargs["fill_method"])
+        fill(bear, kwargs["fill_method"])
 
     # Name and Categorize it
     bull.name = f"BULLP_{length}"
@@ -3,7 +3,7 @@ from numpy import log as nplog
 from numpy import nan as npNaN
 from pandas import DataFrame, Series
 from pandas_ta.overlap import hl2
-from pandas_ta.utils import get_offset, high_low_range, verify_series
+from pandas_ta.utils import fill, get_offset, high_low_range, verify_series
 
 
 def fisher(high, low, length=None, signal=None, offset=None, **kwargs):
@@ -49,8 +49,8 @@ def fisher(high, low, length=None, signal=None, offset=None, **kwargs):
         fisher.fillna(kwargs["fillna"], inplace=True)
         signalma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        fisher.fillna(method=kwargs["fill_method"], inplace=True)
-        signalma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(fisher, kwargs["fill_method"])
+        fill(signalma, kwargs["fill_method"])
 
     # Name and Categorize it
     _props = f"_{length}_{signal}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.overlap import linreg
 from pandas_ta.volatility import rvi
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def inertia(close=None, high=None, low=None, length=None, rvi_length=None, scalar=None, refined=None, thirds=None, mamode=None, drift=None, offset=None, **kwargs):
@@ -43,7 +43,7 @@ def inertia(close=None, high=None, low=None, length=None, rvi_length=None, scala
     if "fillna" in kwargs:
         inertia.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        inertia.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(inertia, kwargs["fill_method"])
 
     # Name & Category
     _props = f"_{length}_{rvi_length}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.overlap import rma
-from pandas_ta.utils import get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_offset, non_zero_range, verify_series
 
 
 def kdj(high=None, low=None, close=None, length=None, signal=None, offset=None, **kwargs):
@@ -39,9 +39,9 @@ def kdj(high=None, low=None, close=None, length=None, signal=None, offset=None,
         d.fillna(kwargs["fillna"], inplace=True)
         j.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        k.fillna(method=kwargs["fill_method"], inplace=True)
-        d.fillna(method=kwargs["fill_method"], inplace=True)
-        j.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(k, kwargs["fill_method"])
+        fill(d, kwargs["fill_method"])
+        fill(j, kwargs["fill_method"])
 
     # Name and Categorize it
     _params = f"_{length}_{signal}"
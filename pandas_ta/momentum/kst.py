@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from .roc import roc
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def kst(close, roc1=None, roc2=None, roc3=None, roc4=None, sma1=None, sma2=None, sma3=None, sma4=None, signal=None, drift=None, offset=None, **kwargs):
@@ -44,8 +44,8 @@ def kst(close, roc1=None, roc2=None, roc3=None, roc4=None, sma1=None, sma2=None,
         kst.fillna(kwargs["fillna"], inplace=True)
         kst_signal.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        kst.fillna(method=kwargs["fill_method"], inplace=True)
-        kst_signal.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(kst, kwargs["fill_method"])
+        fill(kst_signal, kwargs["fill_method"])
 
     # Name and Categorize it
     kst.name = f"KST_{roc1}_{roc2}_{roc3}_{roc4}_{sma1}_{sma2}_{sma3}_{sma4}"
@@ -2,7 +2,7 @@
 from pandas import concat, DataFrame
 from pandas_ta import Imports
 from pandas_ta.overlap import ema
-from pandas_ta.utils import get_offset, verify_series, signals
+from pandas_ta.utils import fill, get_offset, verify_series, signals
 
 
 def macd(close, fast=None, slow=None, signal=None, talib=None, offset=None, **kwargs):
@@ -50,9 +50,9 @@ def macd(close, fast=None, slow=None, signal=None, talib=None, offset=None, **kw
         histogram.fillna(kwargs["fillna"], inplace=True)
         signalma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        macd.fillna(method=kwargs["fill_method"], inplace=True)
-        histogram.fillna(method=kwargs["fill_method"], inplace=True)
-        signalma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(macd, kwargs["fill_method"])
+        fill(histogram, kwargs["fill_method"])
+        fill(signalma, kwargs["fill_method"])
 
     # Name and Categorize it
     _asmode = "AS" if as_mode else ""
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def mom(close, length=None, talib=None, offset=None, **kwargs):
@@ -28,7 +28,7 @@ def mom(close, length=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         mom.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        mom.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(mom, kwargs["fill_method"])
 
     # Name and Categorize it
     mom.name = f"MOM_{length}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.overlap import ema, sma
 from pandas_ta.volatility import atr
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def pgo(high, low, close, length=None, offset=None, **kwargs):
@@ -27,7 +27,7 @@ def pgo(high, low, close, length=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         pgo.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        pgo.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(pgo, kwargs["fill_method"])
 
     # Name and Categorize it
     pgo.name = f"PGO_{length}"
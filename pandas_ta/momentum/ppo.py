@@ -2,7 +2,7 @@
 from pandas import DataFrame
 from pandas_ta import Imports
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_offset, tal_ma, verify_series
+from pandas_ta.utils import fill, get_offset, tal_ma, verify_series
 
 
 def ppo(close, fast=None, slow=None, signal=None, scalar=None, mamode=None, talib=None, offset=None, **kwargs):
@@ -46,9 +46,9 @@ def ppo(close, fast=None, slow=None, signal=None, scalar=None, mamode=None, tali
         histogram.fillna(kwargs["fillna"], inplace=True)
         signalma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        ppo.fillna(method=kwargs["fill_method"], inplace=True)
-        histogram.fillna(method=kwargs["fill_method"], inplace=True)
-        signalma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(ppo, kwargs["fill_method"])
+        fill(histogram, kwargs["fill_method"])
+        fill(signalma, kwargs["fill_method"])
 
     # Name and Categorize it
     _props = f"_{fast}_{slow}_{signal}"
@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
-from numpy import sign as npSign
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from numpy import concatenate as npConcatenate
+from numpy import cumsum as npCumsum
+from numpy import full as npFull
+from numpy import nan as npNaN
+from pandas import Series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def psl(close, open_=None, length=None, scalar=None, drift=None, offset=None, **kwargs):
@@ -17,14 +21,19 @@ def psl(close, open_=None, length=None, scalar=None, drift=None, offset=None, **
     # Calculate Result
     if open_ is not None:
         open_ = verify_series(open_)
-        diff = npSign(close - open_)
+        diff = close - open_
     else:
-        diff = npSign(close.diff(drift))
+        diff = close.diff(drift)
 
-    diff.fillna(0, inplace=True)
-    diff[diff <= 0] = 0  # Zero negative values
+    # Only positive values count, NaN and non positive values are zero
+    up = (diff > 0).values
 
-    psl = scalar * diff.rolling(length).sum()
+    # Rolling sum of the 0/1 bars as a difference of their prefix sums
+    csum = npCumsum(npConcatenate(([0], up)))
+    psl = npFull(close.size, npNaN)
+    psl[length - 1:] = csum[length:] - csum[:-length]
+
+    psl = scalar * Series(psl, index=close.index)
     psl /= length
 
     # Offset
@@ -35,7 +44,7 @@ def psl(close, open_=None, length=None, scalar=None, drift=None, offset=None, **
     if "fillna" in kwargs:
         psl.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        psl.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(psl, kwargs["fill_method"])
 
     # Name and Categorize it
     _props = f"_{length}"
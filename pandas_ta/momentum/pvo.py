@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.overlap import ema
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def pvo(volume, fast=None, slow=None, signal=None, scalar=None, offset=None, **kwargs):
@@ -39,9 +39,9 @@ def pvo(volume, fast=None, slow=None, signal=None, scalar=None, offset=None, **k
         histogram.fillna(kwargs["fillna"], inplace=True)
         signalma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        pvo.fillna(method=kwargs["fill_method"], inplace=True)
-        histogram.fillna(method=kwargs["fill_method"], inplace=True)
-        signalma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(pvo, kwargs["fill_method"])
+        fill(histogram, kwargs["fill_method"])
+        fill(signalma, kwargs["fill_method"])
 
     # Name and Categorize it
     _props = f"_{fast}_{slow}_{signal}"
@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 from numpy import maximum as npMaximum
 from numpy import minimum as npMinimum
+from numpy import full as npFull
 from numpy import nan as npNaN
+from numpy import ones as npOnes
+from numpy import zeros as npZeros
 from pandas import DataFrame, Series
 
 from .rsi import rsi
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def qqe(close, length=None, smooth=None, factor=None, mamode=None, drift=None, offset=None, **kwargs):
@@ -37,49 +40,54 @@ def qqe(close, length=None, smooth=None, factor=None, mamode=None, drift=None, o
     dar = factor * ma("ema", smoothed_rsi_tr_ma, length=wilders_length)
 
     # Create the Upper and Lower Bands around RSI MA.
-    upperband = rsi_ma + dar
-    lowerband = rsi_ma - dar
+    upperband = (rsi_ma + dar).values
+    lowerband = (rsi_ma - dar).values
 
     m = close.size
-    long = Series(0, index=close.index)
-    short = Series(0, index=close.index)
-    trend = Series(1, index=close.index)
-    qqe = Series(rsi_ma.iloc[0], index=close.index)
-    qqe_long = Series(npNaN, index=close.index)
-    qqe_short = Series(npNaN, index=close.index)
+    rsi_ma_ = rsi_ma.values
+    long, short = npZeros(m), npZeros(m)
+    trend = npOnes(m, dtype=int)
+    qqe = npFull(m, rsi_ma_[0])
+    qqe_long, qqe_short = npFull(m, npNaN), npFull(m, npNaN)
 
     for i in range(1, m):
-        c_rsi, p_rsi = rsi_ma.iloc[i], rsi_ma.iloc[i - 1]
-        c_long, p_long = long.iloc[i - 1], long.iloc[i - 2]
-        c_short, p_short = short.iloc[i - 1], short.iloc[i - 2]
+        c_rsi, p_rsi = rsi_ma_[i], rsi_ma_[i - 1]
+        c_long, p_long = long[i - 1], long[i - 2]
+        c_short, p_short = short[i - 1], short[i - 2]
 
         # Long Line
         if p_rsi > c_long and c_rsi > c_long:
-            long.iloc[i] = npMaximum(c_long, lowerband.iloc[i])
+            long[i] = npMaximum(c_long, lowerband[i])
         else:
-            long.iloc[i] = lowerband.iloc[i]
+            long[i] = lowerband[i]
 
         # Short Line
         if p_rsi < c_short and c_rsi < c_short:
-            short.iloc[i] = npMinimum(c_short, upperband.iloc[i])
+            short[i] = npMinimum(c_short, upperband[i])
         else:
-            short.iloc[i] = upperband.iloc[i]
+            short[i] = upperband[i]
 
         # Trend & QQE Calculation
         # Long: Current RSI_MA value Crosses the Prior Short Line Value
         # Short: Current RSI_MA Crosses the Prior Long Line Value
         if (c_rsi > c_short and p_rsi < p_short) or (c_rsi <= c_short and p_rsi >= p_short):
-            trend.iloc[i] = 1
-            qqe.iloc[i] = qqe_long.iloc[i] = long.iloc[i]
+            trend[i] = 1
+            qqe[i] = qqe_long[i] = long[i]
         elif (c_rsi > c_long and p_rsi < p_long) or (c_rsi <= c_long and p_rsi >= p_long):
-            trend.iloc[i] = -1
-            qqe.iloc[i] = qqe_short.iloc[i] = short.iloc[i]
+            trend[i] = -1
+            qqe[i] = qqe_short[i] = short[i]
         else:
-            trend.iloc[i] = trend.iloc[i - 1]
-            if trend.iloc[i] == 1:
-                qqe.iloc[i] = qqe_long.iloc[i] = long.iloc[i]
+            trend[i] = trend[i - 1]
+            if trend[i] == 1:
+                qqe[i] = qqe_long[i] = long[i]
             else:
-                qqe.iloc[i] = qqe_short.iloc[i]  = short.iloc[i]
+                qqe[i] = qqe_short[i]  = short[i]
+
+    long = Series(long, index=close.index)
+    short = Series(short, index=close.index)
+    qqe = Series(qqe, index=close.index)
+    qqe_long = Series(qqe_long, index=close.index)
+    qqe_short = Series(qqe_short, index=close.index)
 
     # Offset
     if offset != 0:
@@ -95,10 +103,10 @@ def qqe(close, length=None, smooth=None, factor=None, mamode=None, drift=None, o
         qqe_long.fillna(kwargs["fillna"], inplace=True)
         qqe_short.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        rsi_ma.fillna(method=kwargs["fill_method"], inplace=True)
-        qqe.fillna(method=kwargs["fill_method"], inplace=True)
-        qqe_long.fillna(method=kwargs["fill_method"], inplace=True)
-        qqe_short.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(rsi_ma, kwargs["fill_method"])
+        fill(qqe, kwargs["fill_method"])
+        fill(qqe_long, kwargs["fill_method"])
+        fill(qqe_short, kwargs["fill_method"])
 
     # Name and Categorize it
     _props = f"{_mode}_{length}_{smooth}_{factor}"
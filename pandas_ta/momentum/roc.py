@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from .mom import mom
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def roc(close, length=None, scalar=None, talib=None, offset=None, **kwargs):
@@ -30,7 +30,7 @@ def roc(close, length=None, scalar=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         roc.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        roc.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(roc, kwargs["fill_method"])
 
     # Name and Categorize it
     roc.name = f"ROC_{length}"
@@ -2,7 +2,7 @@
 from pandas import DataFrame, concat
 from pandas_ta import Imports
 from pandas_ta.overlap import rma
-from pandas_ta.utils import get_drift, get_offset, verify_series, signals
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series, signals
 
 
 def rsi(close, length=None, scalar=None, talib=None, drift=None, offset=None, **kwargs):
@@ -41,7 +41,7 @@ def rsi(close, length=None, scalar=None, talib=None, drift=None, offset=None, **
     if "fillna" in kwargs:
         rsi.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        rsi.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(rsi, kwargs["fill_method"])
 
     # Name and Categorize it
     rsi.name = f"RSI_{length}"
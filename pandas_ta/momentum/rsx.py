@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
 from pandas import concat, DataFrame, Series
-from pandas_ta.utils import get_drift, get_offset, verify_series, signals
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series, signals
 
 
 def rsx(close, length=None, drift=None, offset=None, **kwargs):
@@ -87,7 +87,7 @@ def rsx(close, length=None, drift=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         rsx.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        rsx.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(rsx, kwargs["fill_method"])
 
     # Name and Categorize it
     rsx.name = f"RSX_{length}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.overlap import swma
-from pandas_ta.utils import get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_offset, non_zero_range, verify_series
 
 
 def rvgi(open_, high, low, close, length=None, swma_length=None, offset=None, **kwargs):
@@ -37,8 +37,8 @@ def rvgi(open_, high, low, close, length=None, swma_length=None, offset=None, **
         rvgi.fillna(kwargs["fillna"], inplace=True)
         signal.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        rvgi.fillna(method=kwargs["fill_method"], inplace=True)
-        signal.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(rvgi, kwargs["fill_method"])
+        fill(signal, kwargs["fill_method"])
 
     # Name & Category
     rvgi.name = f"RVGI_{length}_{swma_length}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from numpy import arctan as npAtan
 from numpy import pi as npPi
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def slope( close, length=None, as_angle=None, to_degrees=None, vertical=None, offset=None, **kwargs):
@@ -30,7 +30,7 @@ def slope( close, length=None, as_angle=None, to_degrees=None, vertical=None, of
     if "fillna" in kwargs:
         slope.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        slope.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(slope, kwargs["fill_method"])
 
     # Name and Categorize it
     slope.name = f"SLOPE_{length}" if not as_angle else f"ANGLE{'d' if to_degrees else 'r'}_{length}"
@@ -2,7 +2,7 @@
 from pandas import DataFrame
 from .tsi import tsi
 from pandas_ta.overlap import ema
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def smi(close, fast=None, slow=None, signal=None, scalar=None, offset=None, **kwargs):
@@ -37,9 +37,9 @@ def smi(close, fast=None, slow=None, signal=None, scalar=None, offset=None, **kw
         signalma.fillna(kwargs["fillna"], inplace=True)
         osc.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        smi.fillna(method=kwargs["fill_method"], inplace=True)
-        signalma.fillna(method=kwargs["fill_method"], inplace=True)
-        osc.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(smi, kwargs["fill_method"])
+        fill(signalma, kwargs["fill_method"])
+        fill(osc, kwargs["fill_method"])
 
     # Name and Categorize it
     _scalar = f"_{scalar}" if scalar != 1 else ""
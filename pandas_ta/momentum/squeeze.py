@@ -5,7 +5,7 @@ from pandas_ta.momentum import mom
 from pandas_ta.overlap import ema, linreg, sma
 from pandas_ta.trend import decreasing, increasing
 from pandas_ta.volatility import bbands, kc
-from pandas_ta.utils import get_offset
+from pandas_ta.utils import fill, get_offset
 from pandas_ta.utils import unsigned_differences, verify_series
 
 
@@ -77,10 +77,10 @@ def squeeze(high, low, close, bb_length=None, bb_std=None, kc_length=None, kc_sc
         squeeze_off.fillna(kwargs["fillna"], inplace=True)
         no_squeeze.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        squeeze.fillna(method=kwargs["fill_method"], inplace=True)
-        squeeze_on.fillna(method=kwargs["fill_method"], inplace=True)
-        squeeze_off.fillna(method=kwargs["fill_method"], inplace=True)
-        no_squeeze.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(squeeze, kwargs["fill_method"])
+        fill(squeeze_on, kwargs["fill_method"])
+        fill(squeeze_off, kwargs["fill_method"])
+        fill(no_squeeze, kwargs["fill_method"])
 
     # Name and Categorize it
     _props = "" if use_tr else "hlr"
@@ -130,12 +130,12 @@ def squeeze(high, low, close, bb_length=None, bb_std=None, kc_length=None, kc_sc
             neg_dec.fillna(kwargs["fillna"], inplace=True)
             neg_inc.fillna(kwargs["fillna"], inplace=True)
         if "fill_method" in kwargs:
-            sqz_inc.fillna(method=kwargs["fill_method"], inplace=True)
-            sqz_dec.fillna(method=kwargs["fill_method"], inplace=True)
-            pos_inc.fillna(method=kwargs["fill_method"], inplace=True)
-            pos_dec.fillna(method=kwargs["fill_method"], inplace=True)
-            neg_dec.fillna(method=kwargs["fill_method"], inplace=True)
-            neg_inc.fillna(method=kwargs["fill_method"], inplace=True)
+            fill(sqz_inc, kwargs["fill_method"])
+            fill(sqz_dec, kwargs["fill_method"])
+            fill(pos_inc, kwargs["fill_method"])
+            fill(pos_dec, kwargs["fill_method"])
+            fill(neg_dec, kwargs["fill_method"])
+            fill(neg_inc, kwargs["fill_method"])
 
         df[f"SQZ_INC"] = sqz_inc
         df[f"SQZ_DEC"] = sqz_dec
@@ -5,7 +5,7 @@ from pandas_ta.momentum import mom
 from pandas_ta.overlap import ema, sma
 from pandas_ta.trend import decreasing, increasing
 from pandas_ta.volatility import bbands, kc
-from pandas_ta.utils import get_offset
+from pandas_ta.utils import fill, get_offset
 from pandas_ta.utils import unsigned_differences, verify_series
 
 
@@ -84,12 +84,12 @@ def squeeze_pro(high, low, close, bb_length=None, bb_std=None, kc_length=None, k
         squeeze_off_wide.fillna(kwargs["fillna"], inplace=True)
         no_squeeze.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        squeeze.fillna(method=kwargs["fill_method"], inplace=True)
-        squeeze_on_wide.fillna(method=kwargs["fill_method"], inplace=True)
-        squeeze_on_normal.fillna(method=kwargs["fill_method"], inplace=True)
-        squeeze_on_narrow.fillna(method=kwargs["fill_method"], inplace=True)
-        squeeze_off_wide.fillna(method=kwargs["fill_method"], inplace=True)
-        no_squeeze.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(squeeze, kwargs["fill_method"])
+        fill(squeeze_on_wide, kwargs["fill_method"])
+        fill(squeeze_on_normal, kwargs["fill_method"])
+        fill(squeeze_on_narrow, kwargs["fill_method"])
+        fill(squeeze_off_wide, kwargs["fill_method"])
+        fill(no_squeeze, kwargs["fill_method"])
 
     # Name and Categorize it
     _props = "" if use_tr else "hlr"
@@ -140,12 +140,12 @@ def squeeze_pro(high, low, close, bb_length=None, bb_std=None, kc_length=None, k
             neg_dec.fillna(kwargs["fillna"], inplace=True)
             neg_inc.fillna(kwargs["fillna"], inplace=True)
         if "fill_method" in kwargs:
-            sqz_inc.fillna(method=kwargs["fill_method"], inplace=True)
-            sqz_dec.fillna(method=kwargs["fill_method"], inplace=True)
-            pos_inc.fillna(method=kwargs["fill_method"], inplace=True)
-            pos_dec.fillna(method=kwargs["fill_method"], inplace=True)
-            neg_dec.fillna(method=kwargs["fill_method"], inplace=True)
-            neg_inc.fillna(method=kwargs["fill_method"], inplace=True)
+            fill(sqz_inc, kwargs["fill_method"])
+            fill(sqz_dec, kwargs["fill_method"])
+            fill(pos_inc, kwargs["fill_method"])
+            fill(pos_dec, kwargs["fill_method"])
+            fill(neg_dec, kwargs["fill_method"])
+            fill(neg_inc, kwargs["fill_method"])
 
         df[f"SQZPRO_INC"] = sqz_inc
         df[f"SQZPRO_DEC"] = sqz_dec
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame, Series
 from pandas_ta.overlap import ema
-from pandas_ta.utils import get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_offset, non_zero_range, verify_series
 
 
 def stc(close, tclength=None, fast=None, slow=None, factor=None, offset=None, **kwargs):
@@ -72,9 +72,9 @@ def stc(close, tclength=None, fast=None, slow=None, factor=None, offset=None, **
         macd.fillna(kwargs["fillna"], inplace=True)
         stoch.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        stc.fillna(method=kwargs["fill_method"], inplace=True)
-        macd.fillna(method=kwargs["fill_method"], inplace=True)
-        stoch.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(stc, kwargs["fill_method"])
+        fill(macd, kwargs["fill_method"])
+        fill(stoch, kwargs["fill_method"])
 
     # Name and Categorize it
     _props = f"_{tclength}_{fast}_{slow}_{factor}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_offset, non_zero_range, verify_series
 
 
 def stoch(high, low, close, k=None, d=None, smooth_k=None, mamode=None, offset=None, **kwargs):
@@ -39,8 +39,8 @@ def stoch(high, low, close, k=None, d=None, smooth_k=None, mamode=None, offset=N
         stoch_k.fillna(kwargs["fillna"], inplace=True)
         stoch_d.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        stoch_k.fillna(method=kwargs["fill_method"], inplace=True)
-        stoch_d.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(stoch_k, kwargs["fill_method"])
+        fill(stoch_d, kwargs["fill_method"])
 
     # Name and Categorize it
     _name = "STOCH"
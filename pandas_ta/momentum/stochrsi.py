@@ -2,7 +2,7 @@
 from pandas import DataFrame
 from .rsi import rsi
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_offset, non_zero_range, verify_series
 
 
 def stochrsi(close, length=None, rsi_length=None, k=None, d=None, mamode=None, offset=None, **kwargs):
@@ -39,8 +39,8 @@ def stochrsi(close, length=None, rsi_length=None, k=None, d=None, mamode=None, o
         stochrsi_k.fillna(kwargs["fillna"], inplace=True)
         stochrsi_d.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        stochrsi_k.fillna(method=kwargs["fill_method"], inplace=True)
-        stochrsi_d.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(stochrsi_k, kwargs["fill_method"])
+        fill(stochrsi_d, kwargs["fill_method"])
 
     # Name and Categorize it
     _name = "STOCHRSI"
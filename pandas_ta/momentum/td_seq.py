@@ -2,7 +2,7 @@
 # import numpy as np
 from numpy import where as npWhere
 from pandas import DataFrame, Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def td_seq(close, asint=None, offset=None, **kwargs):
@@ -57,8 +57,8 @@ def td_seq(close, asint=None, offset=None, **kwargs):
         down_seq.fillna(kwargs["fillna"], inplace=True)
 
     if "fill_method" in kwargs:
-        up_seq.fillna(method=kwargs["fill_method"], inplace=True)
-        down_seq.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(up_seq, kwargs["fill_method"])
+        fill(down_seq, kwargs["fill_method"])
 
     # Name & Category
     up_seq.name = f"TD_SEQ_UPa" if show_all else f"TD_SEQ_UP"
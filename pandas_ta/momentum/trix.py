@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.overlap.ema import ema
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def trix(close, length=None, signal=None, scalar=None, drift=None, offset=None, **kwargs):
@@ -34,8 +34,8 @@ def trix(close, length=None, signal=None, scalar=None, drift=None, offset=None,
         trix.fillna(kwargs["fillna"], inplace=True)
         trix_signal.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        trix.fillna(method=kwargs["fill_method"], inplace=True)
-        trix_signal.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(trix, kwargs["fill_method"])
+        fill(trix_signal, kwargs["fill_method"])
 
     # Name & Category
     trix.name = f"TRIX_{length}_{signal}"
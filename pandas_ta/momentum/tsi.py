@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.overlap import ema, ma
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def tsi(close, fast=None, slow=None, signal=None, scalar=None, mamode=None, drift=None, offset=None, **kwargs):
@@ -43,8 +43,8 @@ def tsi(close, fast=None, slow=None, signal=None, scalar=None, mamode=None, drif
         tsi.fillna(kwargs["fillna"], inplace=True)
         tsi_signal.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        tsi.fillna(method=kwargs["fill_method"], inplace=True)
-        tsi_signal.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(tsi, kwargs["fill_method"])
+        fill(tsi_signal, kwargs["fill_method"])
 
     # Name and Categorize it
     tsi.name = f"TSI_{fast}_{slow}_{signal}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta import Imports
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def uo(high, low, close, fast=None, medium=None, slow=None, fast_w=None, medium_w=None, slow_w=None, talib=None, drift=None, offset=None, **kwargs):
@@ -56,7 +56,7 @@ def uo(high, low, close, fast=None, medium=None, slow=None, fast_w=None, medium_
     if "fillna" in kwargs:
         uo.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        uo.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(uo, kwargs["fill_method"])
 
     # Name and Categorize it
     uo.name = f"UO_{fast}_{medium}_{slow}"
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def willr(high, low, close, length=None, talib=None, offset=None, **kwargs):
@@ -35,7 +35,7 @@ def willr(high, low, close, length=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         willr.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        willr.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(willr, kwargs["fill_method"])
 
     # Name and Categorize it
     willr.name = f"WILLR_{length}"
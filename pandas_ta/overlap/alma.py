@@ -2,7 +2,7 @@
 from numpy import exp as npExp
 from numpy import nan as npNaN
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def alma(close, length=None, sigma=None, distribution_offset=None, offset=None, **kwargs):
@@ -46,7 +46,7 @@ def alma(close, length=None, sigma=None, distribution_offset=None, offset=None,
     if "fillna" in kwargs:
         alma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        alma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(alma, kwargs["fill_method"])
 
     # Name & Category
     alma.name = f"ALMA_{length}_{sigma}_{distribution_offset}"
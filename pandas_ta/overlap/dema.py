@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from .ema import ema
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def dema(close, length=None, talib=None, offset=None, **kwargs):
@@ -31,7 +31,7 @@ def dema(close, length=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         dema.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        dema.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(dema, kwargs["fill_method"])
 
     # Name & Category
     dema.name = f"DEMA_{length}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def ema(close, length=None, talib=None, offset=None, **kwargs):
@@ -36,7 +36,7 @@ def ema(close, length=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         ema.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        ema.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(ema, kwargs["fill_method"])
 
     # Name & Category
     ema.name = f"EMA_{length}"
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import fibonacci, get_offset, verify_series, weights
+from pandas_ta.utils import fibonacci, fill, get_offset, verify_series, weighted_window
 
 
 def fwma(close, length=None, asc=None, offset=None, **kwargs):
@@ -14,7 +14,7 @@ def fwma(close, length=None, asc=None, offset=None, **kwargs):
 
     # Calculate Result
     fibs = fibonacci(n=length, weighted=True)
-    fwma = close.rolling(length, min_periods=length).apply(weights(fibs), raw=True)
+    fwma = weighted_window(close, fibs)
 
     # Offset
     if offset != 0:
@@ -24,7 +24,7 @@ def fwma(close, length=None, asc=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         fwma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        fwma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(fwma, kwargs["fill_method"])
 
     # Name & Category
     fwma.name = f"FWMA_{length}"
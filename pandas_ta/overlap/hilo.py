@@ -2,7 +2,7 @@
 from numpy import nan as npNaN
 from pandas import DataFrame, Series
 from .ma import ma
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def hilo(high, low, close, high_length=None, low_length=None, mamode=None, offset=None, **kwargs):
@@ -49,9 +49,9 @@ def hilo(high, low, close, high_length=None, low_length=None, mamode=None, offse
         long.fillna(kwargs["fillna"], inplace=True)
         short.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        hilo.fillna(method=kwargs["fill_method"], inplace=True)
-        long.fillna(method=kwargs["fill_method"], inplace=True)
-        short.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(hilo, kwargs["fill_method"])
+        fill(long, kwargs["fill_method"])
+        fill(short, kwargs["fill_method"])
 
     # Name & Category
     _props = f"_{high_length}_{low_length}"
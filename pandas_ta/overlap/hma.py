@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from numpy import sqrt as npSqrt
 from .wma import wma
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def hma(close, length=None, offset=None, **kwargs):
@@ -29,7 +29,7 @@ def hma(close, length=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         hma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        hma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(hma, kwargs["fill_method"])
 
     # Name & Category
     hma.name = f"HMA_{length}"
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def hwma(close, na=None, nb=None, nc=None, offset=None, **kwargs):
@@ -35,7 +35,7 @@ def hwma(close, na=None, nb=None, nc=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         hwma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        hwma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(hwma, kwargs["fill_method"])
 
     # Name & Category
     suffix = f"{na}_{nb}_{nc}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import date_range, DataFrame, RangeIndex, Timedelta
 from .midprice import midprice
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def ichimoku(high, low, close, tenkan=None, kijun=None, senkou=None, include_chikou=True, offset=None, **kwargs):
@@ -47,9 +47,9 @@ def ichimoku(high, low, close, tenkan=None, kijun=None, senkou=None, include_chi
         span_b.fillna(kwargs["fillna"], inplace=True)
         chikou_span.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        span_a.fillna(method=kwargs["fill_method"], inplace=True)
-        span_b.fillna(method=kwargs["fill_method"], inplace=True)
-        chikou_span.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(span_a, kwargs["fill_method"])
+        fill(span_b, kwargs["fill_method"])
+        fill(chikou_span, kwargs["fill_method"])
 
     # Name and Categorize it
     span_a.name = f"ISA_{tenkan}"
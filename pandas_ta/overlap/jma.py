@@ -6,7 +6,7 @@ from numpy import power as npPower
 from numpy import sqrt as npSqrt
 from numpy import zeros_like as npZeroslike
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def jma(close, length=None, phase=None, offset=None, **kwargs):
@@ -84,7 +84,7 @@ def jma(close, length=None, phase=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         jma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        jma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(jma, kwargs["fill_method"])
 
     # Name & Category
     jma.name = f"JMA_{_length}_{phase}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
 from pandas import Series
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, non_zero_range, verify_series
 
 
 def kama(close, length=None, fast=None, slow=None, drift=None, offset=None, **kwargs):
@@ -45,7 +45,7 @@ def kama(close, length=None, fast=None, slow=None, drift=None, offset=None, **kw
     if "fillna" in kwargs:
         kama.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        kama.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(kama, kwargs["fill_method"])
 
     # Name & Category
     kama.name = f"KAMA_{length}_{fast}_{slow}"
@@ -5,7 +5,7 @@ from numpy import nan as npNaN
 from numpy import pi as npPi
 from numpy.version import version as npVersion
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def linreg(close, length=None, offset=None, **kwargs):
@@ -77,7 +77,7 @@ def linreg(close, length=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         linreg.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        linreg.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(linreg, kwargs["fill_method"])
 
     # Name and Categorize it
     linreg.name = f"LR"
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def mcgd(close, length=None, offset=None, c=None, **kwargs):
@@ -31,7 +31,7 @@ def mcgd(close, length=None, offset=None, c=None, **kwargs):
     if "fillna" in kwargs:
         mcg_ds.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        mcg_ds.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(mcg_ds, kwargs["fill_method"])
 
     # Name & Category
     mcg_ds.name = f"MCGD_{length}"
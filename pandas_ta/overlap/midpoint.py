@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def midpoint(close, length=None, talib=None, offset=None, **kwargs):
@@ -31,7 +31,7 @@ def midpoint(close, length=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         midpoint.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        midpoint.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(midpoint, kwargs["fill_method"])
 
     # Name and Categorize it
     midpoint.name = f"MIDPOINT_{length}"
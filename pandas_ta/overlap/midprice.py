@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def midprice(high, low, length=None, talib=None, offset=None, **kwargs):
@@ -33,7 +33,7 @@ def midprice(high, low, length=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         midprice.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        midprice.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(midprice, kwargs["fill_method"])
 
     # Name and Categorize it
     midprice.name = f"MIDPRICE_{length}"
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, pascals_triangle, verify_series, weights
+from pandas_ta.utils import fill, get_offset, pascals_triangle, verify_series, weighted_window
 
 
 def pwma(close, length=None, asc=None, offset=None, **kwargs):
@@ -14,7 +14,7 @@ def pwma(close, length=None, asc=None, offset=None, **kwargs):
 
     # Calculate Result
     triangle = pascals_triangle(n=length - 1, weighted=True)
-    pwma = close.rolling(length, min_periods=length).apply(weights(triangle), raw=True)
+    pwma = weighted_window(close, triangle)
 
     # Offset
     if offset != 0:
@@ -24,7 +24,7 @@ def pwma(close, length=None, asc=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         pwma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        pwma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(pwma, kwargs["fill_method"])
 
     # Name & Category
     pwma.name = f"PWMA_{length}"
@@ -2,7 +2,7 @@
 from numpy import pi as npPi
 from numpy import sin as npSin
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series, weights
+from pandas_ta.utils import fill, get_offset, verify_series, weighted_window
 
 
 def sinwma(close, length=None, offset=None, **kwargs):
@@ -18,7 +18,7 @@ def sinwma(close, length=None, offset=None, **kwargs):
     sines = Series([npSin((i + 1) * npPi / (length + 1)) for i in range(0, length)])
     w = sines / sines.sum()
 
-    sinwma = close.rolling(length, min_periods=length).apply(weights(w), raw=True)
+    sinwma = weighted_window(close, w)
 
     # Offset
     if offset != 0:
@@ -28,7 +28,7 @@ def sinwma(close, length=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         sinwma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        sinwma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(sinwma, kwargs["fill_method"])
 
     # Name & Category
     sinwma.name = f"SINWMA_{length}"
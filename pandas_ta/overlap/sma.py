@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def sma(close, length=None, talib=None, offset=None, **kwargs):
@@ -29,7 +29,7 @@ def sma(close, length=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         sma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        sma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(sma, kwargs["fill_method"])
 
     # Name & Category
     sma.name = f"SMA_{length}"
@@ -3,7 +3,7 @@ from numpy import cos as npCos
 from numpy import exp as npExp
 from numpy import pi as npPi
 from numpy import sqrt as npSqrt
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def ssf(close, length=None, poles=None, offset=None, **kwargs):
@@ -52,7 +52,7 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         ssf.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        ssf.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(ssf, kwargs["fill_method"])
 
     # Name & Category
     ssf.name = f"SSF_{length}_{poles}"
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
 from numpy import nan as npNaN
+from numpy import ones as npOnes
+from numpy import zeros as npZeros
 from pandas import DataFrame
 from pandas_ta.overlap import hl2
 from pandas_ta.volatility import atr
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def supertrend(high, low, close, length=None, multiplier=None, offset=None, **kwargs):
@@ -20,30 +23,31 @@ def supertrend(high, low, close, length=None, multiplier=None, offset=None, **kw
 
     # Calculate Results
     m = close.size
-    dir_, trend = [1] * m, [0] * m
-    long, short = [npNaN] * m, [npNaN] * m
+    dir_, trend = npOnes(m, dtype=int), npZeros(m)
+    long, short = npFull(m, npNaN), npFull(m, npNaN)
 
     hl2_ = hl2(high, low)
     matr = multiplier * atr(high, low, close, length)
-    upperband = hl2_ + matr
-    lowerband = hl2_ - matr
+    upperband = (hl2_ + matr).to_numpy(copy=True)
+    lowerband = (hl2_ - matr).to_numpy(copy=True)
+    close_ = close.values
 
     for i in range(1, m):
-        if close.iloc[i] > upperband.iloc[i - 1]:
+        if close_[i] > upperband[i - 1]:
             dir_[i] = 1
-        elif close.iloc[i] < lowerband.iloc[i - 1]:
+        elif close_[i] < lowerband[i - 1]:
             dir_[i] = -1
         else:
             dir_[i] = dir_[i - 1]
-            if dir_[i] > 0 and lowerband.iloc[i] < lowerband.iloc[i - 1]:
-                lowerband.iloc[i] = lowerband.iloc[i - 1]
-            if dir_[i] < 0 and upperband.iloc[i] > upperband.iloc[i - 1]:
-                upperband.iloc[i] = upperband.iloc[i - 1]
+            if dir_[i] > 0 and lowerband[i] < lowerband[i - 1]:
+                lowerband[i] = lowerband[i - 1]
+            if dir_[i] < 0 and upperband[i] > upperband[i - 1]:
+                upperband[i] = upperband[i - 1]
 
         if dir_[i] > 0:
-            trend[i] = long[i] = lowerband.iloc[i]
+            trend[i] = long[i] = lowerband[i]
         else:
-            trend[i] = short[i] = upperband.iloc[i]
+            trend[i] = short[i] = upperband[i]
 
     # Prepare DataFrame to return
     _props = f"_{length}_{multiplier}"
@@ -66,7 +70,7 @@ def supertrend(high, low, close, length=None, multiplier=None, offset=None, **kw
         df.fillna(kwargs["fillna"], inplace=True)
 
     if "fill_method" in kwargs:
-        df.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(df, kwargs["fill_method"])
 
     return df
 
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, symmetric_triangle, verify_series, weights
+from pandas_ta.utils import fill, get_offset, symmetric_triangle, verify_series, weighted_window
 
 
 def swma(close, length=None, asc=None, offset=None, **kwargs):
@@ -15,8 +15,7 @@ def swma(close, length=None, asc=None, offset=None, **kwargs):
 
     # Calculate Result
     triangle = symmetric_triangle(length, weighted=True)
-    swma = close.rolling(length, min_periods=length).apply(weights(triangle), raw=True)
-    # swma = close.rolling(length).apply(weights(triangle), raw=True)
+    swma = weighted_window(close, triangle)
 
     # Offset
     if offset != 0:
@@ -26,7 +25,7 @@ def swma(close, length=None, asc=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         swma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        swma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(swma, kwargs["fill_method"])
 
     # Name & Category
     swma.name = f"SWMA_{length}"
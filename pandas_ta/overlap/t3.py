@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from .ema import ema
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def t3(close, length=None, a=None, talib=None, offset=None, **kwargs):
@@ -41,7 +41,7 @@ def t3(close, length=None, a=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         t3.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        t3.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(t3, kwargs["fill_method"])
 
     # Name & Category
     t3.name = f"T3_{length}_{a}"
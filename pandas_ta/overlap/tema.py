@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from .ema import ema
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def tema(close, length=None, talib=None, offset=None, **kwargs):
@@ -32,7 +32,7 @@ def tema(close, length=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         tema.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        tema.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(tema, kwargs["fill_method"])
 
     # Name & Category
     tema.name = f"TEMA_{length}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from .sma import sma
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def trima(close, length=None, talib=None, offset=None, **kwargs):
@@ -31,7 +31,7 @@ def trima(close, length=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         trima.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        trima.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(trima, kwargs["fill_method"])
 
     # Name & Category
     trima.name = f"TRIMA_{length}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
 from pandas import Series
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def vidya(close, length=None, drift=None, offset=None, **kwargs):
@@ -45,7 +45,7 @@ def vidya(close, length=None, drift=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         vidya.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        vidya.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(vidya, kwargs["fill_method"])
 
     # Name & Category
     vidya.name = f"VIDYA_{length}"
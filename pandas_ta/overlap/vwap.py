@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from .hlc3 import hlc3
-from pandas_ta.utils import get_offset, is_datetime_ordered, verify_series
+from pandas_ta.utils import fill, get_offset, is_datetime_ordered, verify_series
 
 def vwap(high, low, close, volume, anchor=None, offset=None, **kwargs):
     """Indicator: Volume Weighted Average Price (VWAP)"""
@@ -31,7 +31,7 @@ def vwap(high, low, close, volume, anchor=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         vwap.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        vwap.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(vwap, kwargs["fill_method"])
 
     # Name & Category
     vwap.name = f"VWAP_{anchor}"
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from .sma import sma
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def vwma(close, volume, length=None, offset=None, **kwargs):
@@ -25,7 +25,7 @@ def vwma(close, volume, length=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         vwma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        vwma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(vwma, kwargs["fill_method"])
 
     # Name & Category
     vwma.name = f"VWMA_{length}"
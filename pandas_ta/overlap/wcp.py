@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def wcp(high, low, close, talib=None, offset=None, **kwargs):
@@ -27,7 +27,7 @@ def wcp(high, low, close, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         wcp.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        wcp.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(wcp, kwargs["fill_method"])
 
     # Name & Category
     wcp.name = "WCP"
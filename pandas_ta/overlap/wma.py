@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
-from pandas import Series
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series, weighted_window
 
 
 def wma(close, length=None, asc=None, talib=None, offset=None, **kwargs):
@@ -21,19 +20,12 @@ def wma(close, length=None, asc=None, talib=None, offset=None, **kwargs):
         wma = WMA(close, length)
     else:
         from numpy import arange as npArange
-        from numpy import dot as npDot
 
         total_weight = 0.5 * length * (length + 1)
-        weights_ = Series(npArange(1, length + 1))
+        weights_ = npArange(1, length + 1)
         weights = weights_ if asc else weights_[::-1]
 
-        def linear(w):
-            def _compute(x):
-                return npDot(x, w) / total_weight
-            return _compute
-
-        close_ = close.rolling(length, min_periods=length)
-        wma = close_.apply(linear(weights), raw=True)
+        wma = weighted_window(close, weights / total_weight)
 
     # Offset
     if offset != 0:
@@ -43,7 +35,7 @@ def wma(close, length=None, asc=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         wma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        wma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(wma, kwargs["fill_method"])
 
     # Name & Category
     wma.name = f"WMA_{length}"
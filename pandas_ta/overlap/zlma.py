@@ -2,7 +2,7 @@
 from . import (
     dema, ema, hma, linreg, rma, sma, swma, t3, tema, trima, vidya, wma
 )
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def zlma(close, length=None, mamode=None, offset=None, **kwargs):
@@ -39,7 +39,7 @@ def zlma(close, length=None, mamode=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         zlma.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        zlma.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(zlma, kwargs["fill_method"])
 
     # Name & Category
     zlma.name = f"ZL_{zlma.name}"
@@ -2,7 +2,7 @@
 from numpy import log as nplog
 from numpy import seterr
 from pandas import DataFrame
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def drawdown(close, offset=None, **kwargs) -> DataFrame:
@@ -33,9 +33,9 @@ def drawdown(close, offset=None, **kwargs) -> DataFrame:
         dd_pct.fillna(kwargs["fillna"], inplace=True)
         dd_log.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        dd.fillna(method=kwargs["fill_method"], inplace=True)
-        dd_pct.fillna(method=kwargs["fill_method"], inplace=True)
-        dd_log.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(dd, kwargs["fill_method"])
+        fill(dd_pct, kwargs["fill_method"])
+        fill(dd_log, kwargs["fill_method"])
 
     # Name and Categorize it
     dd.name = "DD"
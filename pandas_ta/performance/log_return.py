@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from numpy import log as nplog
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def log_return(close, length=None, cumulative=None, offset=None, **kwargs):
@@ -28,7 +28,7 @@ def log_return(close, length=None, cumulative=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         log_return.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        log_return.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(log_return, kwargs["fill_method"])
 
     # Name & Category
     log_return.name = f"{'CUM' if cumulative else ''}LOGRET_{length}"
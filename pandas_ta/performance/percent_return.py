@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def percent_return(close, length=None, cumulative=None, offset=None, **kwargs):
@@ -26,7 +26,7 @@ def percent_return(close, length=None, cumulative=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         pct_return.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        pct_return.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(pct_return, kwargs["fill_method"])
 
     # Name & Category
     pct_return.name = f"{'CUM' if cumulative else ''}PCTRET_{length}"
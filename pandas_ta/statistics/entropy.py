@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from numpy import log as npLog
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def entropy(close, length=None, base=None, offset=None, **kwargs):
@@ -25,7 +25,7 @@ def entropy(close, length=None, base=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         entropy.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        entropy.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(entropy, kwargs["fill_method"])
 
     # Name & Category
     entropy.name = f"ENTP_{length}"
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def kurtosis(close, length=None, offset=None, **kwargs):
@@ -23,7 +23,7 @@ def kurtosis(close, length=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         kurtosis.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        kurtosis.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(kurtosis, kwargs["fill_method"])
 
     # Name & Category
     kurtosis.name = f"KURT_{length}"
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from numpy import fabs as npfabs
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def mad(close, length=None, offset=None, **kwargs):
@@ -28,7 +28,7 @@ def mad(close, length=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         mad.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        mad.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(mad, kwargs["fill_method"])
 
     # Name & Category
     mad.name = f"MAD_{length}"
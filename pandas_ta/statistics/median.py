@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def median(close, length=None, offset=None, **kwargs):
@@ -23,7 +23,7 @@ def median(close, length=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         median.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        median.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(median, kwargs["fill_method"])
 
     # Name & Category
     median.name = f"MEDIAN_{length}"
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def quantile(close, length=None, q=None, offset=None, **kwargs):
@@ -24,7 +24,7 @@ def quantile(close, length=None, q=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         quantile.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        quantile.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(quantile, kwargs["fill_method"])
 
     # Name & Category
     quantile.name = f"QTL_{length}_{q}"
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def skew(close, length=None, offset=None, **kwargs):
@@ -23,7 +23,7 @@ def skew(close, length=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         skew.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        skew.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(skew, kwargs["fill_method"])
 
     # Name & Category
     skew.name = f"SKEW_{length}"
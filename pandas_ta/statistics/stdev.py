@@ -2,7 +2,7 @@
 from numpy import sqrt as npsqrt
 from .variance import variance
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def stdev(close, length=None, ddof=None, talib=None, offset=None, **kwargs):
@@ -31,7 +31,7 @@ def stdev(close, length=None, ddof=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         stdev.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        stdev.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(stdev, kwargs["fill_method"])
 
     # Name & Category
     stdev.name = f"STDEV_{length}"
@@ -5,7 +5,7 @@ from numpy import polyfit as npPolyfit
 from numpy import std as npStd
 from pandas import DataFrame, DatetimeIndex, Series
 from .stdev import stdev as stdev
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 def tos_stdevall(close, length=None, stds=None, ddof=None, offset=None, **kwargs):
     """Indicator: TD Ameritrade's Think or Swim Standard Deviation All"""
@@ -55,7 +55,7 @@ def tos_stdevall(close, length=None, stds=None, ddof=None, offset=None, **kwargs
     if "fillna" in kwargs:
         df.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        df.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(df, kwargs["fill_method"])
 
     # Prepare DataFrame to return
     df.name = f"{_props}"
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def variance(close, length=None, ddof=None, talib=None, offset=None, **kwargs):
@@ -30,7 +30,7 @@ def variance(close, length=None, ddof=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         variance.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        variance.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(variance, kwargs["fill_method"])
 
     # Name & Category
     variance.name = f"VAR_{length}"
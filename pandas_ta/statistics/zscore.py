@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.overlap import sma
 from .stdev import stdev
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def zscore(close, length=None, std=None, offset=None, **kwargs):
@@ -27,7 +27,7 @@ def zscore(close, length=None, std=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         zscore.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        zscore.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(zscore, kwargs["fill_method"])
 
     # Name & Category
     zscore.name = f"ZS_{length}"
@@ -2,7 +2,7 @@
 from pandas import DataFrame
 from pandas_ta.overlap import ma
 from pandas_ta.volatility import atr
-from pandas_ta.utils import get_drift, get_offset, verify_series, zero
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series, zero
 
 
 def adx(high, low, close, length=None, lensig=None, scalar=None, mamode=None, drift=None, offset=None, **kwargs):
@@ -51,9 +51,9 @@ def adx(high, low, close, length=None, lensig=None, scalar=None, mamode=None, dr
         dmp.fillna(kwargs["fillna"], inplace=True)
         dmn.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        adx.fillna(method=kwargs["fill_method"], inplace=True)
-        dmp.fillna(method=kwargs["fill_method"], inplace=True)
-        dmn.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(adx, kwargs["fill_method"])
+        fill(dmp, kwargs["fill_method"])
+        fill(dmn, kwargs["fill_method"])
 
     # Name and Categorize it
     adx.name = f"ADX_{lensig}"
@@ -3,7 +3,7 @@ from pandas import DataFrame
 from .long_run import long_run
 from .short_run import short_run
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def amat(close=None, fast=None, slow=None, lookback=None, mamode=None, offset=None, **kwargs):
@@ -37,8 +37,8 @@ def amat(close=None, fast=None, slow=None, lookback=None, mamode=None, offset=No
         mas_short.fillna(kwargs["fillna"], inplace=True)
 
     if "fill_method" in kwargs:
-        mas_long.fillna(method=kwargs["fill_method"], inplace=True)
-        mas_short.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(mas_long, kwargs["fill_method"])
+        fill(mas_short, kwargs["fill_method"])
 
     # Prepare DataFrame to return
     amatdf = DataFrame({
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 from pandas_ta.utils import recent_maximum_index, recent_minimum_index
 
 
@@ -37,9 +37,9 @@ def aroon(high, low, length=None, scalar=None, talib=None, offset=None, **kwargs
         aroon_down.fillna(kwargs["fillna"], inplace=True)
         aroon_osc.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        aroon_up.fillna(method=kwargs["fill_method"], inplace=True)
-        aroon_down.fillna(method=kwargs["fill_method"], inplace=True)
-        aroon_osc.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(aroon_up, kwargs["fill_method"])
+        fill(aroon_down, kwargs["fill_method"])
+        fill(aroon_osc, kwargs["fill_method"])
 
     # Offset
     if offset != 0:
@@ -2,7 +2,7 @@
 from numpy import log10 as npLog10
 from numpy import log as npLn
 from pandas_ta.volatility import atr
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def chop(high, low, close, length=None, atr_length=None, ln=None, scalar=None, drift=None, offset=None, **kwargs):
@@ -40,7 +40,7 @@ def chop(high, low, close, length=None, atr_length=None, ln=None, scalar=None, d
     if "fillna" in kwargs:
         chop.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        chop.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(chop, kwargs["fill_method"])
 
     # Name and Categorize it
     chop.name = f"CHOP{'ln' if ln else ''}_{length}_{atr_length}_{scalar}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.volatility import atr
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def cksp(high, low, close, p=None, x=None, q=None, tvmode=None, offset=None, **kwargs):
@@ -41,8 +41,8 @@ def cksp(high, low, close, p=None, x=None, q=None, tvmode=None, offset=None, **k
         long_stop.fillna(kwargs["fillna"], inplace=True)
         short_stop.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        long_stop.fillna(method=kwargs["fill_method"], inplace=True)
-        short_stop.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(long_stop, kwargs["fill_method"])
+        fill(short_stop, kwargs["fill_method"])
 
     # Name and Categorize it
     _props = f"_{p}_{x}_{q}"
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
+from numpy import concatenate as npConcatenate
 from numpy import exp as npExp
-from pandas import DataFrame
-from pandas_ta.utils import get_offset, verify_series
+from numpy import fmax as npFmax
+from pandas import Series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def decay(close, kind=None, length=None, mode=None, offset=None, **kwargs):
@@ -15,15 +17,15 @@ def decay(close, kind=None, length=None, mode=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    _mode = "L"
-    if mode == "exp" or kind == "exponential":
-        _mode = "EXP"
-        diff = close.shift(1) - npExp(-length)
+    if mode in ["exp", "exponential"] or kind == "exponential":
+        _mode, rate = "EXP", npExp(-length)
     else:  # "linear"
-        diff = close.shift(1) - (1 / length)
-    diff[0] = close[0]
-    tdf = DataFrame({"close": close, "diff": diff, "0": 0})
-    ld = tdf.max(axis=1)
+        _mode, rate = "L", 1 / length
+
+    close_ = close.values
+    diff = npConcatenate((close_[:1], close_[:-1] - rate))
+    ld = npFmax(npFmax(close_, diff), 0)
+    ld = Series(ld, index=close.index)
 
     # Offset
     if offset != 0:
@@ -33,7 +35,7 @@ def decay(close, kind=None, length=None, mode=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         ld.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        ld.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(ld, kwargs["fill_method"])
 
     # Name and Categorize it
     ld.name = f"{_mode}DECAY_{length}"
@@ -63,7 +65,8 @@ Calculation:
 Args:
     close (pd.Series): Series of 'close's
     length (int): It's period. Default: 1
-    mode (str): If 'exp' then "exponential" decay. Default: 'linear'
+    mode (str): If 'exp' or 'exponential' then "exponential" decay.
+        Default: 'linear'
     offset (int): How many periods to offset the result. Default: 0
 
 Kwargs:
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.overlap import sma
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def dpo(close, length=None, centered=True, offset=None, **kwargs):
@@ -30,7 +30,7 @@ def dpo(close, length=None, centered=True, offset=None, **kwargs):
     if "fillna" in kwargs:
         dpo.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        dpo.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(dpo, kwargs["fill_method"])
 
     # Name and Categorize it
     dpo.name = f"DPO_{length}"
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_drift, get_offset, is_percent, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, is_percent, verify_series
 
 def increasing(close, length=None, strict=None, asint=None, percent=None, drift=None, offset=None, **kwargs):
     """Indicator: Increasing"""
@@ -38,7 +38,7 @@ def increasing(close, length=None, strict=None, asint=None, percent=None, drift=
     if "fillna" in kwargs:
         increasing.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        increasing.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(increasing, kwargs["fill_method"])
 
     # Name and Categorize it
     _percent = f"_{0.01 * percent}" if percent else ''
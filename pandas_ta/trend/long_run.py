@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from .decreasing import decreasing
 from .increasing import increasing
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def long_run(fast, slow, length=None, offset=None, **kwargs):
@@ -27,7 +27,7 @@ def long_run(fast, slow, length=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         long_run.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        long_run.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(long_run, kwargs["fill_method"])
 
     # Name and Categorize it
     long_run.name = f"LR_{length}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
 from pandas import DataFrame, Series
-from pandas_ta.utils import get_offset, verify_series, zero
+from pandas_ta.utils import fill, get_offset, verify_series, zero
 
 
 def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **kwargs):
@@ -97,10 +97,10 @@ def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **k
         short.fillna(kwargs["fillna"], inplace=True)
         reversal.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        _af.fillna(method=kwargs["fill_method"], inplace=True)
-        long.fillna(method=kwargs["fill_method"], inplace=True)
-        short.fillna(method=kwargs["fill_method"], inplace=True)
-        reversal.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(_af, kwargs["fill_method"])
+        fill(long, kwargs["fill_method"])
+        fill(short, kwargs["fill_method"])
+        fill(reversal, kwargs["fill_method"])
 
     # Prepare DataFrame to return
     _params = f"_{af0}_{max_af}"
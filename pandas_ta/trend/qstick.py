@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.overlap import dema, ema, hma, rma, sma
-from pandas_ta.utils import get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_offset, non_zero_range, verify_series
 
 
 def qstick(open_, close, length=None, offset=None, **kwargs):
@@ -36,7 +36,7 @@ def qstick(open_, close, length=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         qstick.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        qstick.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(qstick, kwargs["fill_method"])
 
     # Name and Categorize it
     qstick.name = f"QS_{length}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.overlap import hl2
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def ttm_trend(high, low, close, length=None, offset=None, **kwargs):
@@ -33,7 +33,7 @@ def ttm_trend(high, low, close, length=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         tm_trend.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        tm_trend.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(tm_trend, kwargs["fill_method"])
 
     # Name and Categorize it
     tm_trend.name = f"TTM_TRND_{length}"
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from numpy import fabs as npFabs
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, non_zero_range, verify_series
 
 
 def vhf(close, length=None, drift=None, offset=None, **kwargs):
@@ -27,7 +27,7 @@ def vhf(close, length=None, drift=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         vhf.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        vhf.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(vhf, kwargs["fill_method"])
 
     # Name and Categorize it
     vhf.name = f"VHF_{length}"
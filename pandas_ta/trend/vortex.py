@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.volatility import true_range
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def vortex(high, low, close, length=None, drift=None, offset=None, **kwargs):
@@ -38,8 +38,8 @@ def vortex(high, low, close, length=None, drift=None, offset=None, **kwargs):
         vip.fillna(kwargs["fillna"], inplace=True)
         vim.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        vip.fillna(method=kwargs["fill_method"], inplace=True)
-        vim.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(vip, kwargs["fill_method"])
+        fill(vim, kwargs["fill_method"])
 
     # Name and Categorize it
     vip.name = f"VTXP_{length}"
@@ -3,7 +3,7 @@ from numpy import nan as npNaN
 from pandas import DataFrame
 from .tsignals import tsignals
 from pandas_ta.utils._signals import cross_value
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def xsignals(signal, xa, xb, above:bool=True, long:bool=True, asbool:bool=None, trend_reset:int=0, trade_offset:int=None, offset:int=None, **kwargs):
@@ -49,7 +49,7 @@ def xsignals(signal, xa, xb, above:bool=True, long:bool=True, asbool:bool=None,
     if "fillna" in kwargs:
         df.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        df.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(df, kwargs["fill_method"])
 
     # Name & Category
     df.name = f"XS"
@@ -4,6 +4,7 @@ from pathlib import Path
 from sys import float_info as sflt
 
 from numpy import argmax, argmin
+from numpy import sign as npSign
 from pandas import DataFrame, Series
 from pandas.api.types import is_datetime64_any_dtype
 from pandas_ta import Imports
@@ -24,6 +25,18 @@ def category_files(category: str) -> list:
     return files
 
 
+def fill(x: DataFrame or Series, method: str) -> DataFrame or Series:
+    """Fills NaNs of a Series or DataFrame in place with 'ffill' ('pad') or
+    'bfill' ('backfill'). Raises a ValueError for any other method."""
+    if method in ["ffill", "pad"]:
+        x.ffill(inplace=True)
+    elif method in ["bfill", "backfill"]:
+        x.bfill(inplace=True)
+    else:
+        raise ValueError(f"Invalid fill method. Expecting pad (ffill) or backfill (bfill). Got {method}")
+    return x
+
+
 def get_drift(x: int) -> int:
     """Returns an int if not zero, otherwise defaults to one."""
     return int(x) if isinstance(x, int) and x != 0 else 1
@@ -76,9 +89,7 @@ def signed_series(series: Series, initial: int = None) -> Series:
     sign = Series([NaN, -1.0, 0.0, -1.0, 0.0, 1.0, 1.0, 0.0, 1.0, -1.0])
     """
     series = verify_series(series)
-    sign = series.diff(1)
-    sign[sign > 0] = 1
-    sign[sign < 0] = -1
+    sign = npSign(series.diff(1))
     sign.iloc[0] = initial
     return sign
 
@@ -112,19 +123,12 @@ def unsigned_differences(series: Series, amount: int = None, **kwargs) -> Series
     negative = Series([0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 1])
     """
     amount = int(amount) if amount is not None else 1
-    negative = series.diff(amount)
-    negative.fillna(0, inplace=True)
-    positive = negative.copy()
-
-    positive[positive <= 0] = 0
-    positive[positive > 0] = 1
-
-    negative[negative >= 0] = 0
-    negative[negative < 0] = 1
+    dtype = int if kwargs.pop("asint", False) else float
 
-    if kwargs.pop("asint", False):
-        positive = positive.astype(int)
-        negative = negative.astype(int)
+    # NaN differences compare False and become zero
+    diff = series.diff(amount)
+    positive = (diff > 0).astype(dtype)
+    negative = (diff < 0).astype(dtype)
 
     return positive, negative
 
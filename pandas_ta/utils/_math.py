@@ -9,10 +9,12 @@ from numpy import ones, triu
 from numpy import all as npAll
 from numpy import append as npAppend
 from numpy import array as npArray
+from numpy import convolve as npConvolve
 from numpy import corrcoef as npCorrcoef
 from numpy import dot as npDot
 from numpy import fabs as npFabs
 from numpy import exp as npExp
+from numpy import full as npFull
 from numpy import log as npLog
 from numpy import nan as npNaN
 from numpy import ndarray as npNdArray
@@ -201,6 +203,20 @@ def weights(w: npNdArray):
     return _dot
 
 
+def weighted_window(series: Series, w: npNdArray) -> Series:
+    """Rolling dot product of the weights w with every window of the series.
+
+    Equivalent to series.rolling(len(w)).apply(weights(w), raw=True) but
+    computed as a single convolution instead of a Python call per window.
+    """
+    series = verify_series(series)
+    w = npArray(w, dtype=float)
+    result = npFull(series.size, npNaN)
+    if series.size >= w.size:
+        result[w.size - 1:] = npConvolve(series.values, w[::-1], mode="valid")
+    return Series(result, index=series.index)
+
+
 def zero(x: Tuple[int, float]) -> Tuple[int, float]:
     """If the value is close to zero, then return zero. Otherwise return itself."""
     return 0 if abs(x) < sflt.epsilon else x
@@ -3,7 +3,7 @@
 from pandas import DataFrame
 from .atr import atr
 from pandas_ta.overlap import hlc3, sma
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def aberration(high, low, close, length=None, atr_length=None, offset=None, **kwargs):
@@ -41,10 +41,10 @@ def aberration(high, low, close, length=None, atr_length=None, offset=None, **kw
         xg.fillna(kwargs["fillna"], inplace=True)
         atr_.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        zg.fillna(method=kwargs["fill_method"], inplace=True)
-        sg.fillna(method=kwargs["fill_method"], inplace=True)
-        xg.fillna(method=kwargs["fill_method"], inplace=True)
-        atr_.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(zg, kwargs["fill_method"])
+        fill(sg, kwargs["fill_method"])
+        fill(xg, kwargs["fill_method"])
+        fill(atr_, kwargs["fill_method"])
 
     # Name and Categorize it
     _props = f"_{length}_{atr_length}"
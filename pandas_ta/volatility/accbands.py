@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, non_zero_range, verify_series
 
 
 def accbands(high, low, close, length=None, c=None, drift=None, mamode=None, offset=None, **kwargs):
@@ -41,9 +41,9 @@ def accbands(high, low, close, length=None, c=None, drift=None, mamode=None, off
         mid.fillna(kwargs["fillna"], inplace=True)
         upper.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        lower.fillna(method=kwargs["fill_method"], inplace=True)
-        mid.fillna(method=kwargs["fill_method"], inplace=True)
-        upper.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(lower, kwargs["fill_method"])
+        fill(mid, kwargs["fill_method"])
+        fill(upper, kwargs["fill_method"])
 
     # Name and Categorize it
     lower.name = f"ACCBL_{length}"
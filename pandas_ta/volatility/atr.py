@@ -2,7 +2,7 @@
 from .true_range import true_range
 from pandas_ta import Imports
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def atr(high, low, close, length=None, mamode=None, talib=None, drift=None, offset=None, **kwargs):
@@ -39,7 +39,7 @@ def atr(high, low, close, length=None, mamode=None, talib=None, drift=None, offs
     if "fillna" in kwargs:
         atr.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        atr.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(atr, kwargs["fill_method"])
 
     # Name and Categorize it
     atr.name = f"ATR{mamode[0]}_{length}{'p' if percentage else ''}"
@@ -3,7 +3,7 @@ from pandas import DataFrame
 from pandas_ta import Imports
 from pandas_ta.overlap import ma
 from pandas_ta.statistics import stdev
-from pandas_ta.utils import get_offset, non_zero_range, tal_ma, verify_series
+from pandas_ta.utils import fill, get_offset, non_zero_range, tal_ma, verify_series
 
 
 def bbands(close, length=None, std=None, ddof=0, mamode=None, talib=None, offset=None, **kwargs):
@@ -52,11 +52,11 @@ def bbands(close, length=None, std=None, ddof=0, mamode=None, talib=None, offset
         bandwidth.fillna(kwargs["fillna"], inplace=True)
         percent.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        lower.fillna(method=kwargs["fill_method"], inplace=True)
-        mid.fillna(method=kwargs["fill_method"], inplace=True)
-        upper.fillna(method=kwargs["fill_method"], inplace=True)
-        bandwidth.fillna(method=kwargs["fill_method"], inplace=True)
-        percent.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(lower, kwargs["fill_method"])
+        fill(mid, kwargs["fill_method"])
+        fill(upper, kwargs["fill_method"])
+        fill(bandwidth, kwargs["fill_method"])
+        fill(percent, kwargs["fill_method"])
 
     # Name and Categorize it
     lower.name = f"BBL_{length}_{std}"
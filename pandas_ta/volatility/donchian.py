@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def donchian(high, low, lower_length=None, upper_length=None, offset=None, **kwargs):
@@ -28,9 +28,9 @@ def donchian(high, low, lower_length=None, upper_length=None, offset=None, **kwa
         mid.fillna(kwargs["fillna"], inplace=True)
         upper.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        lower.fillna(method=kwargs["fill_method"], inplace=True)
-        mid.fillna(method=kwargs["fill_method"], inplace=True)
-        upper.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(lower, kwargs["fill_method"])
+        fill(mid, kwargs["fill_method"])
+        fill(upper, kwargs["fill_method"])
 
     # Offset
     if offset != 0:
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from numpy import sqrt as npSqrt
 from pandas import DataFrame, Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def hwc(close, na=None, nb=None, nc=None, nd=None, scalar=None, channel_eval=None, offset=None, **kwargs):
@@ -76,12 +76,12 @@ def hwc(close, na=None, nb=None, nc=None, nd=None, scalar=None, channel_eval=Non
             hwc_pctwidth.fillna(kwargs["fillna"], inplace=True)
 
     if "fill_method" in kwargs:
-        hwc.fillna(method=kwargs["fill_method"], inplace=True)
-        hwc_upper.fillna(method=kwargs["fill_method"], inplace=True)
-        hwc_lower.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(hwc, kwargs["fill_method"])
+        fill(hwc_upper, kwargs["fill_method"])
+        fill(hwc_lower, kwargs["fill_method"])
         if channel_eval:
-            hwc_width.fillna(method=kwargs["fill_method"], inplace=True)
-            hwc_pctwidth.fillna(method=kwargs["fill_method"], inplace=True)
+            fill(hwc_width, kwargs["fill_method"])
+            fill(hwc_pctwidth, kwargs["fill_method"])
 
     # Name and Categorize it
     # suffix = f'{str(na).replace(".", "")}-{str(nb).replace(".", "")}-{str(nc).replace(".", "")}'
@@ -94,17 +94,14 @@ def hwc(close, na=None, nb=None, nc=None, nd=None, scalar=None, channel_eval=Non
         hwc_pctwidth.name = "HWPCT"
 
     # Prepare DataFrame to return
+    data = {hwc.name: hwc, hwc_upper.name: hwc_upper, hwc_lower.name: hwc_lower}
     if channel_eval:
-        data = {hwc.name: hwc, hwc_upper.name: hwc_upper, hwc_lower.name: hwc_lower,
-                hwc_width.name: hwc_width, hwc_pctwidth.name: hwc_pctwidth}
-        df = DataFrame(data)
-        df.name = "HWC"
-        df.category = hwc.category
-    else:
-        data = {hwc.name: hwc, hwc_upper.name: hwc_upper, hwc_lower.name: hwc_lower}
-        df = DataFrame(data)
-        df.name = "HWC"
-        df.category = hwc.category
+        data[hwc_width.name] = hwc_width
+        data[hwc_pctwidth.name] = hwc_pctwidth
+
+    df = DataFrame(data)
+    df.name = "HWC"
+    df.category = hwc.category
 
     return df
 
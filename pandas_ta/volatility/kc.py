@@ -2,7 +2,7 @@
 from pandas import DataFrame
 from .true_range import true_range
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_offset, high_low_range, verify_series
+from pandas_ta.utils import fill, get_offset, high_low_range, verify_series
 
 
 def kc(high, low, close, length=None, scalar=None, mamode=None, offset=None, **kwargs):
@@ -43,9 +43,9 @@ def kc(high, low, close, length=None, scalar=None, mamode=None, offset=None, **k
         basis.fillna(kwargs["fillna"], inplace=True)
         upper.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        lower.fillna(method=kwargs["fill_method"], inplace=True)
-        basis.fillna(method=kwargs["fill_method"], inplace=True)
-        upper.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(lower, kwargs["fill_method"])
+        fill(basis, kwargs["fill_method"])
+        fill(upper, kwargs["fill_method"])
 
     # Name and Categorize it
     _props = f"{mamode.lower()[0] if len(mamode) else ''}_{length}_{scalar}"
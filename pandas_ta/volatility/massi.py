@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.overlap import ema
-from pandas_ta.utils import get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_offset, non_zero_range, verify_series
 
 
 def massi(high, low, fast=None, slow=None, offset=None, **kwargs):
@@ -34,7 +34,7 @@ def massi(high, low, fast=None, slow=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         massi.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        massi.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(massi, kwargs["fill_method"])
 
     # Name and Categorize it
     massi.name = f"MASSI_{fast}_{slow}"
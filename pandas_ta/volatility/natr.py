@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from .atr import atr
 from pandas_ta import Imports
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def natr(high, low, close, length=None, scalar=None, mamode=None, talib=None, drift=None, offset=None, **kwargs):
@@ -35,7 +35,7 @@ def natr(high, low, close, length=None, scalar=None, mamode=None, talib=None, dr
     if "fillna" in kwargs:
         natr.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        natr.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(natr, kwargs["fill_method"])
 
     # Name and Categorize it
     natr.name = f"NATR_{length}"
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, non_zero_range, verify_series
 
 
 def pdist(open_, high, low, close, drift=None, offset=None, **kwargs):
@@ -25,7 +25,7 @@ def pdist(open_, high, low, close, drift=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         pdist.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        pdist.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(pdist, kwargs["fill_method"])
 
     # Name & Category
     pdist.name = "PDIST"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.overlap import ma
 from pandas_ta.statistics import stdev
-from pandas_ta.utils import get_drift, get_offset
+from pandas_ta.utils import fill, get_drift, get_offset
 from pandas_ta.utils import unsigned_differences, verify_series
 
 
@@ -62,7 +62,7 @@ def rvi(close, high=None, low=None, length=None, scalar=None, refined=None, thir
     if "fillna" in kwargs:
         rvi.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        rvi.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(rvi, kwargs["fill_method"])
 
     # Name and Categorize it
     rvi.name = f"RVI{_mode}_{length}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_offset, verify_series, get_drift
+from pandas_ta.utils import fill, get_offset, verify_series, get_drift
 
 
 def thermo(high, low, length=None, long=None, short=None, mamode=None, drift=None, offset=None, **kwargs):
@@ -52,10 +52,10 @@ def thermo(high, low, length=None, long=None, short=None, mamode=None, drift=Non
         thermo_long.fillna(kwargs["fillna"], inplace=True)
         thermo_short.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        thermo.fillna(method=kwargs["fill_method"], inplace=True)
-        thermo_ma.fillna(method=kwargs["fill_method"], inplace=True)
-        thermo_long.fillna(method=kwargs["fill_method"], inplace=True)
-        thermo_short.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(thermo, kwargs["fill_method"])
+        fill(thermo_ma, kwargs["fill_method"])
+        fill(thermo_long, kwargs["fill_method"])
+        fill(thermo_short, kwargs["fill_method"])
 
     # Name and Categorize it
     _props = f"_{length}_{long}_{short}"
@@ -2,7 +2,7 @@
 from numpy import nan as npNaN
 from pandas import concat
 from pandas_ta import Imports
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, non_zero_range, verify_series
 
 
 def true_range(high, low, close, talib=None, drift=None, offset=None, **kwargs):
@@ -35,7 +35,7 @@ def true_range(high, low, close, talib=None, drift=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         true_range.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        true_range.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(true_range, kwargs["fill_method"])
 
     # Name and Categorize it
     true_range.name = f"TRUERANGE_{drift}"
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from numpy import sqrt as npsqrt
 from pandas_ta.overlap import sma
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def ui(close, length=None, scalar=None, offset=None, **kwargs):
@@ -35,7 +35,7 @@ def ui(close, length=None, scalar=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         ui.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        ui.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(ui, kwargs["fill_method"])
 
     # Name and Categorize it
     ui.name = f"UI{'' if not everget else 'e'}_{length}"
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_offset, non_zero_range, verify_series
 
 
 def ad(high, low, close, volume, open_=None, talib=None, offset=None, **kwargs):
@@ -36,7 +36,7 @@ def ad(high, low, close, volume, open_=None, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         ad.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        ad.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(ad, kwargs["fill_method"])
 
     # Name and Categorize it
     ad.name = "AD" if open_ is None else "ADo"
@@ -2,7 +2,7 @@
 from .ad import ad
 from pandas_ta import Imports
 from pandas_ta.overlap import ema
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def adosc(high, low, close, volume, open_=None, fast=None, slow=None, talib=None, offset=None, **kwargs):
@@ -39,7 +39,7 @@ def adosc(high, low, close, volume, open_=None, fast=None, slow=None, talib=None
     if "fillna" in kwargs:
         adosc.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        adosc.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(adosc, kwargs["fill_method"])
 
     # Name and Categorize it
     adosc.name = f"ADOSC_{fast}_{slow}"
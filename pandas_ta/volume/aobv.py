@@ -3,7 +3,7 @@ from pandas import DataFrame
 from .obv import obv
 from pandas_ta.overlap import ma
 from pandas_ta.trend import long_run, short_run
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fill, get_offset, verify_series
 
 
 def aobv(close, volume, fast=None, slow=None, max_lookback=None, min_lookback=None, mamode=None, offset=None, **kwargs):
@@ -50,11 +50,11 @@ def aobv(close, volume, fast=None, slow=None, max_lookback=None, min_lookback=No
         obv_long.fillna(kwargs["fillna"], inplace=True)
         obv_short.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        obv_.fillna(method=kwargs["fill_method"], inplace=True)
-        maf.fillna(method=kwargs["fill_method"], inplace=True)
-        mas.fillna(method=kwargs["fill_method"], inplace=True)
-        obv_long.fillna(method=kwargs["fill_method"], inplace=True)
-        obv_short.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(obv_, kwargs["fill_method"])
+        fill(maf, kwargs["fill_method"])
+        fill(mas, kwargs["fill_method"])
+        fill(obv_long, kwargs["fill_method"])
+        fill(obv_short, kwargs["fill_method"])
 
     # Prepare DataFrame to return
     _mode = mamode.lower()[0] if len(mamode) else ""
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_offset, non_zero_range, verify_series
 
 
 def cmf(high, low, close, volume, open_=None, length=None, offset=None, **kwargs):
@@ -35,7 +35,7 @@ def cmf(high, low, close, volume, open_=None, length=None, offset=None, **kwargs
     if "fillna" in kwargs:
         cmf.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        cmf.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(cmf, kwargs["fill_method"])
 
     # Name and Categorize it
     cmf.name = f"CMF_{length}"
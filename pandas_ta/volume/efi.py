@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def efi(close, volume, length=None, mamode=None, drift=None, offset=None, **kwargs):
@@ -27,7 +27,7 @@ def efi(close, volume, length=None, mamode=None, drift=None, offset=None, **kwar
     if "fillna" in kwargs:
         efi.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        efi.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(efi, kwargs["fill_method"])
 
     # Name and Categorize it
     efi.name = f"EFI_{length}"
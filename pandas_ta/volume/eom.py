@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.overlap import hl2, sma
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, non_zero_range, verify_series
 
 
 def eom(high, low, close, volume, length=None, divisor=None, drift=None, offset=None, **kwargs):
@@ -34,7 +34,7 @@ def eom(high, low, close, volume, length=None, divisor=None, drift=None, offset=
     if "fillna" in kwargs:
         eom.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        eom.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(eom, kwargs["fill_method"])
 
     # Name and Categorize it
     eom.name = f"EOM_{length}_{divisor}"
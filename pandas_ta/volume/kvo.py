@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.overlap import hlc3, ma
-from pandas_ta.utils import get_drift, get_offset, signed_series, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, signed_series, verify_series
 
 
 def kvo(high, low, close, volume, fast=None, slow=None, signal=None, mamode=None, drift=None, offset=None, **kwargs):
@@ -37,8 +37,8 @@ def kvo(high, low, close, volume, fast=None, slow=None, signal=None, mamode=None
         kvo.fillna(kwargs["fillna"], inplace=True)
         kvo_signal.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        kvo.fillna(method=kwargs["fill_method"], inplace=True)
-        kvo_signal.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(kvo, kwargs["fill_method"])
+        fill(kvo_signal, kwargs["fill_method"])
 
     # Name and Categorize it
     _props = f"_{fast}_{slow}_{signal}"
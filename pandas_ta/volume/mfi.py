@@ -2,7 +2,7 @@
 from pandas import DataFrame
 from pandas_ta import Imports
 from pandas_ta.overlap import hlc3
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def mfi(high, low, close, volume, length=None, talib=None, drift=None, offset=None, **kwargs):
@@ -49,7 +49,7 @@ def mfi(high, low, close, volume, length=None, talib=None, drift=None, offset=No
     if "fillna" in kwargs:
         mfi.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        mfi.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(mfi, kwargs["fill_method"])
 
     # Name and Categorize it
     mfi.name = f"MFI_{length}"
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.momentum import roc
-from pandas_ta.utils import get_offset, signed_series, verify_series
+from pandas_ta.utils import fill, get_offset, signed_series, verify_series
 
 
 def nvi(close, volume, length=None, initial=None, offset=None, **kwargs):
@@ -31,7 +31,7 @@ def nvi(close, volume, length=None, initial=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         nvi.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        nvi.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(nvi, kwargs["fill_method"])
 
     # Name and Categorize it
     nvi.name = f"NVI_{length}"
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, signed_series, verify_series
+from pandas_ta.utils import fill, get_offset, signed_series, verify_series
 
 
 def obv(close, volume, talib=None, offset=None, **kwargs):
@@ -27,7 +27,7 @@ def obv(close, volume, talib=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         obv.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        obv.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(obv, kwargs["fill_method"])
 
     # Name and Categorize it
     obv.name = f"OBV"
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.momentum import roc
-from pandas_ta.utils import get_offset, signed_series, verify_series
+from pandas_ta.utils import fill, get_offset, signed_series, verify_series
 
 
 def pvi(close, volume, length=None, initial=None, offset=None, **kwargs):
@@ -30,7 +30,7 @@ def pvi(close, volume, length=None, initial=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         pvi.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        pvi.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(pvi, kwargs["fill_method"])
 
     # Name and Categorize it
     pvi.name = f"PVI_{length}"
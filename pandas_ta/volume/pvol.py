@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, signed_series, verify_series
+from pandas_ta.utils import fill, get_offset, signed_series, verify_series
 
 
 def pvol(close, volume, offset=None, **kwargs):
@@ -23,7 +23,7 @@ def pvol(close, volume, offset=None, **kwargs):
     if "fillna" in kwargs:
         pvol.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        pvol.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(pvol, kwargs["fill_method"])
 
     # Name and Categorize it
     pvol.name = f"PVOL"
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta.momentum import roc
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fill, get_drift, get_offset, verify_series
 
 
 def pvt(close, volume, drift=None, offset=None, **kwargs):
@@ -23,7 +23,7 @@ def pvt(close, volume, drift=None, offset=None, **kwargs):
     if "fillna" in kwargs:
         pvt.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        pvt.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(pvt, kwargs["fill_method"])
 
     # Name and Categorize it
     pvt.name = f"PVT"
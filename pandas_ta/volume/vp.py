@@ -2,7 +2,7 @@
 from numpy import array_split
 from numpy import mean
 from pandas import cut, concat, DataFrame
-from pandas_ta.utils import signed_series, verify_series
+from pandas_ta.utils import fill, signed_series, verify_series
 
 
 def vp(close, volume, width=None, **kwargs):
@@ -64,7 +64,7 @@ def vp(close, volume, width=None, **kwargs):
     if "fillna" in kwargs:
         vpdf.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        vpdf.fillna(method=kwargs["fill_method"], inplace=True)
+        fill(vpdf, kwargs["fill_method"])
 
     # Name and Categorize it
     vpdf.name = f"VP_{width}"
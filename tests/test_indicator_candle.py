@@ -77,4 +77,15 @@ class TestCandle(TestCase):
     def test_cdl_z(self):
         result = pandas_ta.cdl_z(self.open, self.high, self.low, self.close)
         self.assertIsInstance(result, DataFrame)
-        self.assertEqual(result.name, "CDL_Z_30_1")
\ No newline at end of file
+        self.assertEqual(result.name, "CDL_Z_30_1")
+
+        result = pandas_ta.cdl_z(self.open, self.high, self.low, self.close, full=True)
+        self.assertIsInstance(result, DataFrame)
+        self.assertFalse(result.isna().any().any())
+
+        open_ = self.open.copy()
+        open_.iloc[50] = None
+        result = pandas_ta.cdl_z(open_, self.high, self.low, self.close, fill_method="ffill")
+        self.assertIsInstance(result, DataFrame)
+        self.assertFalse(result.iloc[29:].isna().any().any())
+        self.assertRaises(ValueError, pandas_ta.cdl_z, open_, self.high, self.low, self.close, fill_method="nearest")
@@ -320,6 +320,14 @@ class TestMomentum(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "PSL_12")
 
+        result = pandas_ta.psl(self.close, open_=self.open)
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.name, "PSL_12")
+
+        result = pandas_ta.psl(self.close.iloc[:32], open_=self.open.iloc[:32], length=32)
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.count(), 1)
+
     def test_pvo(self):
         result = pandas_ta.pvo(self.volume)
         self.assertIsInstance(result, DataFrame)
@@ -330,6 +338,10 @@ class TestMomentum(TestCase):
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "QQE_14_5_4.236")
 
+        result = pandas_ta.qqe(self.close.iloc[:32])
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.shape, (32, 4))
+
     def test_roc(self):
         result = pandas_ta.roc(self.close, talib=False)
         self.assertIsInstance(result, Series)
@@ -327,6 +327,17 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "SMA_10")
 
+        close = self.close.copy()
+        close.iloc[[20, 40, 41]] = None
+        expected = pandas_ta.sma(close, talib=False)
+        for method in ["ffill", "pad"]:
+            result = pandas_ta.sma(close, talib=False, fill_method=method)
+            pdt.assert_series_equal(result, expected.ffill())
+        for method in ["bfill", "backfill"]:
+            result = pandas_ta.sma(close, talib=False, fill_method=method)
+            pdt.assert_series_equal(result, expected.bfill())
+        self.assertRaises(ValueError, pandas_ta.sma, close, talib=False, fill_method="nearest")
+
     def test_ssf(self):
         result = pandas_ta.ssf(self.close, poles=2)
         self.assertIsInstance(result, Series)
@@ -346,6 +357,10 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "SUPERT_7_3.0")
 
+        result = pandas_ta.supertrend(self.high.iloc[:32], self.low.iloc[:32], self.close.iloc[:32])
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.shape, (32, 4))
+
     def test_t3(self):
         result = pandas_ta.t3(self.close, talib=False)
         self.assertIsInstance(result, Series)
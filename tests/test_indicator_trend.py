@@ -127,6 +127,10 @@ class TestTrend(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "EXPDECAY_5")
 
+        result = pandas_ta.decay(self.close, mode="exponential")
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.name, "EXPDECAY_5")
+
     def test_decreasing(self):
         result = pandas_ta.decreasing(self.close)
         self.assertIsInstance(result, Series)
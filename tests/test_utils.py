@@ -181,6 +181,23 @@ class TestUtilities(TestCase):
         npt.assert_allclose(self.utils.fibonacci(n=5, zero=True, weighted=True), np.array([0, 1 / 12, 1 / 12, 1 / 6, 1 / 4, 5 / 12]))
         npt.assert_allclose(self.utils.fibonacci(n=5, zero=False, weighted=True), np.array([1 / 12, 1 / 12, 1 / 6, 1 / 4, 5 / 12]))
 
+    def test_fill(self):
+        series = Series([np.nan, 1, np.nan, np.nan, 4, np.nan])
+        for method in ["ffill", "pad"]:
+            result = self.utils.fill(series.copy(), method)
+            npt.assert_array_equal(result, np.array([np.nan, 1, 1, 1, 4, 4]))
+
+        for method in ["bfill", "backfill"]:
+            result = self.utils.fill(series.copy(), method)
+            npt.assert_array_equal(result, np.array([1, 1, 4, 4, 4, np.nan]))
+
+        df = DataFrame({"a": series, "b": series[::-1].values})
+        self.utils.fill(df, "ffill")
+        npt.assert_array_equal(df["a"], np.array([np.nan, 1, 1, 1, 4, 4]))
+        npt.assert_array_equal(df["b"], np.array([np.nan, 4, 4, 4, 1, 1]))
+
+        self.assertRaises(ValueError, self.utils.fill, series.copy(), "nearest")
+        self.assertRaises(ValueError, self.utils.fill, series.copy(), None)
 
     def test_geometric_mean(self):
         returns = pandas_ta.percent_return(self.data.close)
@@ -263,6 +280,15 @@ class TestUtilities(TestCase):
         npt.assert_array_equal(self.utils.pascals_triangle(n=5, weighted=True), array_5w)
         npt.assert_array_equal(self.utils.pascals_triangle(n=5, weighted=True, inverse=True), array_5iw)
 
+    def test_signed_series(self):
+        series = Series([3, 2, 2, 1, 1, 5, 6, 6, 7, 5])
+        result = self.utils.signed_series(series)
+        self.assertIsInstance(result, Series)
+        npt.assert_array_equal(result, np.array([np.nan, -1, 0, -1, 0, 1, 1, 0, 1, -1]))
+
+        result = self.utils.signed_series(series, initial=1)
+        npt.assert_array_equal(result, np.array([1, -1, 0, -1, 0, 1, 1, 0, 1, -1]))
+
     def test_symmetric_triangle(self):
         npt.assert_array_equal(self.utils.symmetric_triangle(), np.array([1,1]))
         npt.assert_array_equal(self.utils.symmetric_triangle(weighted=True), np.array([0.5, 0.5]))
@@ -289,6 +315,38 @@ class TestUtilities(TestCase):
         self.assertEqual(self.utils.tal_ma("mama"), 7)
         self.assertEqual(self.utils.tal_ma("t3"), 8)
 
+    def test_unsigned_differences(self):
+        series = Series([3, 2, 2, 1, 1, 5, 6, 6, 7, 5, 3])
+        positive, negative = self.utils.unsigned_differences(series)
+        self.assertIsInstance(positive, Series)
+        self.assertIsInstance(negative, Series)
+        self.assertEqual(positive.dtype, float)
+        npt.assert_array_equal(positive, np.array([0, 0, 0, 0, 0, 1, 1, 0, 1, 0, 0]))
+        npt.assert_array_equal(negative, np.array([0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 1]))
+
+        positive, negative = self.utils.unsigned_differences(series, asint=True)
+        self.assertEqual(positive.dtype, int)
+        self.assertEqual(negative.dtype, int)
+        npt.assert_array_equal(positive, np.array([0, 0, 0, 0, 0, 1, 1, 0, 1, 0, 0]))
+        npt.assert_array_equal(negative, np.array([0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 1]))
+
+        series = Series([3, np.nan, 2, 4])
+        positive, negative = self.utils.unsigned_differences(series)
+        npt.assert_array_equal(positive, np.array([0, 0, 0, 1]))
+        npt.assert_array_equal(negative, np.array([0, 0, 0, 0]))
+
+    def test_weighted_window(self):
+        w = self.utils.fibonacci(n=5, weighted=True)
+        result = self.utils.weighted_window(self.data.close, w)
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.size, self.data.close.size)
+
+        expected = self.data.close.rolling(w.size).apply(self.utils.weights(w), raw=True)
+        npt.assert_allclose(result, expected)
+
+        result = self.utils.weighted_window(Series([1, 2, 3, 4]), [1, 2])
+        npt.assert_array_equal(result, np.array([np.nan, 5, 8, 11]))
+
     def test_zero(self):
         self.assertEqual(self.utils.zero(-0.0000000000000001), 0)
         self.assertEqual(self.utils.zero(0), 0)